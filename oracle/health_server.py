@@ -1,17 +1,44 @@
 import asyncio
+import logging
+from typing import Awaitable, Callable, Dict
 
 from aiohttp import web
 
-from oracle.settings import HEALTH_SERVER_HOST, HEALTH_SERVER_PORT
+from oracle.settings import HEALTH_CHECK_TIMEOUT, HEALTH_SERVER_HOST, HEALTH_SERVER_PORT
 
+logger = logging.getLogger(__name__)
 
-def start_health_server(runner):
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(runner.setup())
-    site = web.TCPSite(runner, HEALTH_SERVER_HOST, HEALTH_SERVER_PORT)
-    loop.run_until_complete(site.start())
-    loop.run_forever()
+# health checks that are still running, keyed by the service name
+HEALTH_CHECKS: Dict[str, asyncio.Future] = {}
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    # the check can outlive the probes that have timed out waiting for it
+    if not future.cancelled():
+        future.exception()
+
+
+async def check_health(
+    name: str, is_healthy: Callable[[], Awaitable[bool]]
+) -> web.Response:
+    """Runs the health check with the timeout and responds with its status."""
+    # the check running in the worker thread can't be cancelled on timeout,
+    # concurrent probes share it instead of starting new ones until it finishes
+    check = HEALTH_CHECKS.get(name)
+    if check is None or check.done():
+        check = asyncio.ensure_future(is_healthy())
+        check.add_done_callback(_retrieve_exception)
+        HEALTH_CHECKS[name] = check
+
+    try:
+        if await asyncio.wait_for(asyncio.shield(check), timeout=HEALTH_CHECK_TIMEOUT):
+            return web.Response(text=f"{name} 1")
+    except asyncio.TimeoutError:
+        logger.debug(f"{name} health check has timed out")
+    except Exception as e:
+        logger.debug(f"{name} health check has failed: {e!r}")
+
+    return web.Response(text=f"{name} 0")
 
 
 def create_health_server_runner(routes):
@@ -19,3 +46,12 @@ def create_health_server_runner(routes):
     app.add_routes(routes)
     runner = web.AppRunner(app, access_log=None)
     return runner
+
+
+async def mount_health_server(routes) -> web.AppRunner:
+    """Serves health server routes on the running event loop."""
+    runner = create_health_server_runner(routes)
+    await runner.setup()
+    site = web.TCPSite(runner, HEALTH_SERVER_HOST, HEALTH_SERVER_PORT)
+    await site.start()
+    return runner
@@ -1,13 +1,37 @@
 import logging
+from functools import lru_cache
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 from web3.middleware import construct_sign_and_send_raw_middleware, geth_poa_middleware
 
-from oracle.settings import NETWORK_CONFIG
+from oracle.settings import KEEPER_HTTP_POOL_SIZE, NETWORK_CONFIG
+from oracle.utils import get_oracle_local_account
 
 logger = logging.getLogger(__name__)
 
+# hosts with the pooled connections: ETH1 node and the votes aggregator,
+# the number of connections per host is set with KEEPER_HTTP_POOL_SIZE
+HTTP_POOL_HOSTS = 8
 
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Returns HTTP session with the connection pool shared by the keeper requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_HOSTS,
+        pool_maxsize=KEEPER_HTTP_POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.1),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
 def get_web3_client() -> Web3:
     """Returns instance of the Web3 client."""
     endpoint = NETWORK_CONFIG["KEEPER_ETH1_ENDPOINT"]
@@ -15,21 +39,21 @@ def get_web3_client() -> Web3:
     # Prefer WS over HTTP
     if endpoint.startswith("ws"):
         w3 = Web3(Web3.WebsocketProvider(endpoint, websocket_timeout=60))
-        logger.warning(f"Web3 websocket endpoint={endpoint}")
+        logger.info(f"Web3 websocket endpoint={endpoint}")
     elif endpoint.startswith("http"):
-        w3 = Web3(Web3.HTTPProvider(endpoint))
-        logger.warning(f"Web3 HTTP endpoint={endpoint}")
+        w3 = Web3(Web3.HTTPProvider(endpoint, session=get_http_session()))
+        logger.info(f"Web3 HTTP endpoint={endpoint}")
     else:
         w3 = Web3(Web3.IPCProvider(endpoint))
-        logger.warning(f"Web3 HTTP endpoint={endpoint}")
+        logger.info(f"Web3 HTTP endpoint={endpoint}")
 
     if NETWORK_CONFIG["IS_POA"]:
         w3.middleware_onion.inject(geth_poa_middleware, layer=0)
-        logger.warning("Injected POA middleware")
+        logger.info("Injected POA middleware")
 
-    account = w3.eth.account.from_key(NETWORK_CONFIG["ORACLE_PRIVATE_KEY"])
+    account = get_oracle_local_account()
     w3.middleware_onion.add(construct_sign_and_send_raw_middleware(account))
-    logger.warning("Injected middleware for capturing transactions and sending as raw")
+    logger.info("Injected middleware for capturing transactions and sending as raw")
 
     w3.eth.default_account = account.address
     logger.info(f"Configured default account {w3.eth.default_account}")
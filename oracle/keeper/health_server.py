@@ -1,5 +1,8 @@
+import asyncio
+
 from aiohttp import web
 
+from oracle.health_server import check_health
 from oracle.keeper.clients import get_web3_client
 from oracle.keeper.contracts import get_multicall_contract, get_oracles_contract
 from oracle.keeper.utils import get_keeper_params, get_oracles_votes
@@ -8,35 +11,35 @@ from oracle.settings import NETWORK_CONFIG
 keeper_routes = web.RouteTableDef()
 
 
+def is_keeper_healthy() -> bool:
+    web3_client = get_web3_client()
+    oracles_contract = get_oracles_contract(web3_client)
+    multicall_contract = get_multicall_contract(web3_client)
+
+    # Check ETH1 node connection, can fetch oracle votes and is not paused
+    params = get_keeper_params(oracles_contract, multicall_contract)
+    if params.paused:
+        return False
+
+    # Check oracle is part of the set
+    oracle_account = web3_client.eth.default_account
+    assert oracle_account in params.oracles
+
+    # Check oracle has enough balance
+    balance = web3_client.eth.get_balance(oracle_account)
+    assert balance > NETWORK_CONFIG["KEEPER_MIN_BALANCE"]
+
+    # Can resolve and fetch recent votes of the oracles
+    get_oracles_votes(
+        web3_client=web3_client,
+        rewards_nonce=params.rewards_nonce,
+        oracles=params.oracles,
+    )
+
+    return True
+
+
 @keeper_routes.get("/")
 async def health(request):
-    try:
-        web3_client = get_web3_client()
-        oracles_contract = get_oracles_contract(web3_client)
-        multicall_contract = get_multicall_contract(web3_client)
-
-        # Check ETH1 node connection and oracle is part of the set
-        oracle_account = web3_client.eth.default_account
-        assert oracles_contract.functions.isOracle(oracle_account).call()
-
-        # Check oracle has enough balance
-        balance = web3_client.eth.get_balance(oracle_account)
-        assert balance > NETWORK_CONFIG["KEEPER_MIN_BALANCE"]
-
-        # Can fetch oracle votes and is not paused
-        params = get_keeper_params(oracles_contract, multicall_contract)
-        if params.paused:
-            return web.Response(text="keeper 0")
-
-        # Can resolve and fetch recent votes of the oracles
-        get_oracles_votes(
-            web3_client=web3_client,
-            rewards_nonce=params.rewards_nonce,
-            oracles=params.oracles,
-        )
-
-        return web.Response(text="keeper 1")
-    except:  # noqa: E722
-        pass
-
-    return web.Response(text="keeper 0")
+    # web3 calls are blocking, run them outside of the event loop
+    return await check_health("keeper", lambda: asyncio.to_thread(is_keeper_healthy))
@@ -1,8 +1,9 @@
+import asyncio
 import logging
-import threading
-import time
 
-from oracle.health_server import create_health_server_runner, start_health_server
+import uvloop
+
+from oracle.health_server import mount_health_server
 from oracle.keeper.clients import get_web3_client
 from oracle.keeper.contracts import get_multicall_contract, get_oracles_contract
 from oracle.keeper.health_server import keeper_routes
@@ -27,39 +28,42 @@ logging.getLogger("backoff").addHandler(logging.StreamHandler())
 logger = logging.getLogger(__name__)
 
 
-def main() -> None:
+async def main() -> None:
+    health_server_runner = None
+    if ENABLE_HEALTH_SERVER:
+        logger.info(
+            f"Starting monitoring server at http://{HEALTH_SERVER_HOST}:{HEALTH_SERVER_PORT}"
+        )
+        health_server_runner = await mount_health_server(keeper_routes)
+
     # wait for interrupt
     interrupt_handler = InterruptHandler()
     web3_client = get_web3_client()
     multicall_contract = get_multicall_contract(web3_client)
     oracles_contract = get_oracles_contract(web3_client)
 
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
     while not interrupt_handler.exit:
-        # Fetch current nonces of the validators, rewards and the total number of oracles
+        # schedule from the iteration start, so that the work time isn't added to the interval
+        next_tick = max(next_tick, loop.time()) + KEEPER_PROCESS_INTERVAL
 
-        params = get_keeper_params(oracles_contract, multicall_contract)
-        if params.paused:
-            time.sleep(KEEPER_PROCESS_INTERVAL)
-            continue
+        # Fetch current nonces of the validators, rewards and the total number of oracles
+        # web3 calls are blocking, run them outside of the event loop
+        params = await asyncio.to_thread(
+            get_keeper_params, oracles_contract, multicall_contract
+        )
+        if not params.paused:
+            # If nonces match the current for the majority, submit the transactions
+            await asyncio.to_thread(submit_votes, web3_client, oracles_contract, params)
 
-        # If nonces match the current for the majority, submit the transactions
-        submit_votes(web3_client, oracles_contract, params)
+        await interrupt_handler.wait(max(0, next_tick - loop.time()))
 
-        time.sleep(KEEPER_PROCESS_INTERVAL)
+    if health_server_runner is not None:
+        await health_server_runner.cleanup()
 
 
 if __name__ == "__main__":
-    if ENABLE_HEALTH_SERVER:
-        t = threading.Thread(
-            target=start_health_server,
-            args=(create_health_server_runner(keeper_routes),),
-            daemon=True,
-        )
-        logger.info(
-            f"Starting monitoring server at http://{HEALTH_SERVER_HOST}:{HEALTH_SERVER_PORT}"
-        )
-        t.start()
-
     if SENTRY_DSN:
         import sentry_sdk
         from sentry_sdk.integrations.logging import ignore_logger
@@ -67,4 +71,5 @@ if __name__ == "__main__":
         sentry_sdk.init(SENTRY_DSN, traces_sample_rate=0.1)
         ignore_logger("backoff")
 
-    main()
+    uvloop.install()
+    asyncio.run(main())
@@ -1,10 +1,12 @@
 import logging
 import time
 from collections import Counter
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import Dict, List, Tuple, Union
 
 import backoff
-import requests
 from eth_account.messages import encode_defunct
 from eth_typing import BlockNumber, ChecksumAddress, HexStr
 from hexbytes import HexBytes
@@ -12,60 +14,73 @@ from web3 import Web3
 from web3.contract import Contract, ContractFunction
 from web3.types import TxParams
 
+from oracle.keeper.clients import get_http_session
 from oracle.keeper.typings import Parameters
 from oracle.oracle.distributor.common.types import DistributorVote
+from oracle.oracle.utils import to_checksum_address
 from oracle.settings import (
     CONFIRMATION_BLOCKS,
     DISTRIBUTOR_VOTE_FILENAME,
+    KEEPER_HTTP_POOL_SIZE,
+    KEEPER_HTTP_TIMEOUT,
+    KEEPER_PROCESS_INTERVAL,
     NETWORK_CONFIG,
     TRANSACTION_TIMEOUT,
 )
+from oracle.utils import ttl_cache
 
 logger = logging.getLogger(__name__)
 
 ORACLE_ROLE = Web3.solidityKeccak(["string"], ["ORACLE_ROLE"])
 
+get_distributor_vote_key = itemgetter("merkle_root", "merkle_proofs")
 
+# results shared by the processing loop and the health server
+KEEPER_CACHE_TTL = KEEPER_PROCESS_INTERVAL / 2
+
+# votes requests share the HTTP connections pool, one worker per connection
+VOTES_EXECUTOR = ThreadPoolExecutor(
+    max_workers=KEEPER_HTTP_POOL_SIZE, thread_name_prefix="keeper-votes"
+)
+
+# encoded calls of the view functions polled every iteration
+MULTICALL_CALLS_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=MULTICALL_CALLS_CACHE_SIZE)
+def get_multicall_call(contract: Contract, fn_name: str, args: Tuple = ()) -> Dict:
+    """Returns encoded multicall call of the contract function."""
+    return {
+        "target": contract.address,
+        "callData": contract.encodeABI(fn_name=fn_name, args=list(args)),
+    }
+
+
+@ttl_cache(ttl=KEEPER_CACHE_TTL)
 @backoff.on_exception(backoff.expo, Exception, max_time=900)
 def get_keeper_params(
     oracles_contract: Contract, multicall_contract: Contract
 ) -> Parameters:
     """Returns keeper params for checking whether to submit the votes."""
     calls = [
-        {
-            "target": oracles_contract.address,
-            "callData": oracles_contract.encodeABI(fn_name="paused"),
-        },
-        {
-            "target": oracles_contract.address,
-            "callData": oracles_contract.encodeABI(fn_name="currentRewardsNonce"),
-        },
-        {
-            "target": oracles_contract.address,
-            "callData": oracles_contract.encodeABI(
-                fn_name="getRoleMemberCount", args=[ORACLE_ROLE]
-            ),
-        },
+        get_multicall_call(oracles_contract, "paused"),
+        get_multicall_call(oracles_contract, "currentRewardsNonce"),
+        get_multicall_call(oracles_contract, "getRoleMemberCount", (ORACLE_ROLE,)),
     ]
     response = multicall_contract.functions.aggregate(calls).call()[1]
 
     paused = bool(Web3.toInt(primitive=response[0]))
     rewards_nonce = Web3.toInt(primitive=response[1])
     total_oracles = Web3.toInt(primitive=response[2])
-    calls = []
-    for i in range(total_oracles):
-        calls.append(
-            {
-                "target": oracles_contract.address,
-                "callData": oracles_contract.encodeABI(
-                    fn_name="getRoleMember", args=[ORACLE_ROLE, i]
-                ),
-            }
-        )
+    calls = [
+        get_multicall_call(oracles_contract, "getRoleMember", (ORACLE_ROLE, i))
+        for i in range(total_oracles)
+    ]
     response = multicall_contract.functions.aggregate(calls).call()[1]
-    oracles: List[ChecksumAddress] = []
-    for addr in response:
-        oracles.append(Web3.toChecksumAddress(Web3.toBytes(Web3.toInt(addr))))
+    # addresses are ABI encoded to 32 bytes, checksums of the same oracles are cached
+    oracles: List[ChecksumAddress] = [
+        to_checksum_address(addr[-20:]) for addr in response
+    ]
 
     return Parameters(
         paused=paused,
@@ -105,42 +120,56 @@ def check_distributor_vote(
         return validate_vote_signature(
             web3_client, encoded_data, oracle, vote["signature"]
         )
-    except:  # noqa: E722
+    except Exception:
         return False
 
 
-def get_oracles_votes(
+def get_oracle_vote(
     web3_client: Web3,
     rewards_nonce: int,
-    oracles: List[ChecksumAddress],
-) -> List[DistributorVote]:
-    """Fetches oracle votes that match current nonces."""
-    votes = []
+    oracle: ChecksumAddress,
+) -> Union[DistributorVote, None]:
+    """Fetches oracle vote that matches current nonce."""
     aws_bucket_name = NETWORK_CONFIG["AWS_BUCKET_NAME"]
     aws_region = NETWORK_CONFIG["AWS_REGION"]
 
-    for oracle in oracles:
-        # TODO: support more aggregators (GCP, Azure, etc.)
-        bucket_key = f"{oracle}/{DISTRIBUTOR_VOTE_FILENAME}"
-        try:
-            response = requests.get(
-                f"https://{aws_bucket_name}.s3.{aws_region}.amazonaws.com/{bucket_key}"
+    # TODO: support more aggregators (GCP, Azure, etc.)
+    bucket_key = f"{oracle}/{DISTRIBUTOR_VOTE_FILENAME}"
+    try:
+        response = get_http_session().get(
+            f"https://{aws_bucket_name}.s3.{aws_region}.amazonaws.com/{bucket_key}",
+            timeout=KEEPER_HTTP_TIMEOUT,
+        )
+        response.raise_for_status()
+        vote = response.json()
+        if "nonce" not in vote or vote["nonce"] != rewards_nonce:
+            return None
+        if not check_distributor_vote(web3_client, vote, oracle):
+            logger.warning(
+                f"Oracle {oracle} has submitted incorrect vote at {bucket_key}"
             )
-            response.raise_for_status()
-            vote = response.json()
-            if "nonce" not in vote or vote["nonce"] != rewards_nonce:
-                continue
-            if not check_distributor_vote(web3_client, vote, oracle):
-                logger.warning(
-                    f"Oracle {oracle} has submitted incorrect vote at {bucket_key}"
-                )
-                continue
+            return None
 
-            votes.append(vote)
-        except:  # noqa: E722
-            pass
+        return vote
+    except Exception:
+        return None
 
-    return votes
+
+@ttl_cache(ttl=KEEPER_CACHE_TTL)
+def get_oracles_votes(
+    web3_client: Web3,
+    rewards_nonce: int,
+    oracles: List[ChecksumAddress],
+) -> List[DistributorVote]:
+    """Fetches oracle votes that match current nonces."""
+    if not oracles:
+        return []
+
+    # votes are fetched from the aggregator concurrently
+    votes = VOTES_EXECUTOR.map(
+        partial(get_oracle_vote, web3_client, rewards_nonce), oracles
+    )
+    return [vote for vote in votes if vote is not None]
 
 
 def can_submit(signatures_count: int, total_oracles: int) -> bool:
@@ -209,7 +238,7 @@ def submit_votes(
     )
     total_oracles = len(params.oracles)
 
-    counter = Counter([(vote["merkle_root"], vote["merkle_proofs"]) for vote in votes])
+    counter = Counter(map(get_distributor_vote_key, votes))
     most_voted = counter.most_common(1)
     if most_voted and can_submit(most_voted[0][1], total_oracles):
         merkle_root, merkle_proofs = most_voted[0][0]
@@ -217,10 +246,7 @@ def submit_votes(
         i = 0
         while not can_submit(len(signatures), total_oracles):
             vote = votes[i]
-            if (merkle_root, merkle_proofs) == (
-                vote["merkle_root"],
-                vote["merkle_proofs"],
-            ):
+            if (merkle_root, merkle_proofs) == get_distributor_vote_key(vote):
                 signatures.append(vote["signature"])
             i += 1
 
@@ -234,3 +260,7 @@ def submit_votes(
             ),
         )
         logger.info("Merkle Distributor has been successfully updated")
+
+        # rewards nonce has changed, drop cached params and votes
+        get_keeper_params.cache_clear()
+        get_oracles_votes.cache_clear()
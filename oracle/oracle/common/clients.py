@@ -1,12 +1,17 @@
 import asyncio
 import logging
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Tuple, Union
 
 import backoff
+import orjson
+from aiohttp import ClientSession, TCPConnector
 from gql import Client
+from gql.client import AsyncClientSession
 from gql.transport.aiohttp import AIOHTTPTransport
 from graphql import DocumentNode
 
+from oracle.settings import AIOHTTP_CONNECTOR_LIMIT, AIOHTTP_LIMIT_PER_HOST
+
 gql_logger = logging.getLogger("gql_logger")
 gql_handler = logging.StreamHandler()
 gql_logger.addHandler(gql_handler)
@@ -19,6 +24,27 @@ EXECUTE_TIMEOUT = 45
 # set default GQL pagination
 PAGINATION_WINDOWS = 1000
 
+# HTTP statuses that won't succeed on retry
+NON_TRANSIENT_STATUSES = (400, 401, 403, 404)
+
+# connections are shared by all the clients, they are bound to the event loop
+CLIENTS_LOOP: Union[asyncio.AbstractEventLoop, None] = None
+AIOHTTP_CONNECTOR: Union[TCPConnector, None] = None
+AIOHTTP_SESSION: Union[ClientSession, None] = None
+GQL_SESSIONS: Dict[str, Tuple[Client, AsyncClientSession]] = {}
+
+
+def is_non_transient_error(e: Exception) -> bool:
+    """Checks whether the request has failed with the error that retries won't fix."""
+    # aiohttp errors store HTTP status in `status`, gql transport errors in `code`
+    status = getattr(e, "status", None) or getattr(e, "code", None)
+    return status in NON_TRANSIENT_STATUSES
+
+
+def json_serialize(data: Any) -> str:
+    """Serializes GraphQL request payload with orjson."""
+    return orjson.dumps(data).decode()
+
 
 def get_network_config(network):
     try:
@@ -33,12 +59,89 @@ class GraphqlConsensusError(ConnectionError):
     pass
 
 
+def _check_clients_loop() -> None:
+    """
+    Drops the clients left by the event loop that is no longer running.
+    They can't be closed without their loop, call `close_clients` before it stops.
+    """
+    global CLIENTS_LOOP, AIOHTTP_CONNECTOR, AIOHTTP_SESSION
+    loop = asyncio.get_running_loop()
+    if CLIENTS_LOOP is not loop:
+        CLIENTS_LOOP = loop
+        AIOHTTP_CONNECTOR = None
+        AIOHTTP_SESSION = None
+        GQL_SESSIONS.clear()
+
+
+def get_aiohttp_connector() -> TCPConnector:
+    """Returns TCP connector shared by the clients."""
+    global AIOHTTP_CONNECTOR
+    _check_clients_loop()
+    if AIOHTTP_CONNECTOR is None or AIOHTTP_CONNECTOR.closed:
+        AIOHTTP_CONNECTOR = TCPConnector(
+            limit=AIOHTTP_CONNECTOR_LIMIT,
+            limit_per_host=AIOHTTP_LIMIT_PER_HOST,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
+
+    return AIOHTTP_CONNECTOR
+
+
+def get_aiohttp_session() -> ClientSession:
+    """Returns aiohttp session shared by the clients."""
+    global AIOHTTP_SESSION
+    _check_clients_loop()
+    if AIOHTTP_SESSION is None or AIOHTTP_SESSION.closed:
+        AIOHTTP_SESSION = ClientSession(
+            connector=get_aiohttp_connector(), connector_owner=False
+        )
+
+    return AIOHTTP_SESSION
+
+
+async def get_gql_session(subgraph_url: str) -> AsyncClientSession:
+    """Returns permanent GQL session for the subgraph URL."""
+    _check_clients_loop()
+    if subgraph_url in GQL_SESSIONS:
+        return GQL_SESSIONS[subgraph_url][1]
+
+    transport = AIOHTTPTransport(
+        url=subgraph_url,
+        json_serialize=json_serialize,
+        client_session_args=dict(
+            connector=get_aiohttp_connector(), connector_owner=False
+        ),
+    )
+    client = Client(transport=transport, execute_timeout=EXECUTE_TIMEOUT)
+    session = await client.connect_async()
+    GQL_SESSIONS[subgraph_url] = (client, session)
+
+    return session
+
+
+async def close_clients() -> None:
+    """Closes the sessions and connections shared by the clients."""
+    global AIOHTTP_CONNECTOR, AIOHTTP_SESSION
+    _check_clients_loop()
+    while GQL_SESSIONS:
+        _, (client, _) = GQL_SESSIONS.popitem()
+        await client.close_async()
+
+    if AIOHTTP_SESSION is not None:
+        await AIOHTTP_SESSION.close()
+        AIOHTTP_SESSION = None
+
+    if AIOHTTP_CONNECTOR is not None:
+        await AIOHTTP_CONNECTOR.close()
+        AIOHTTP_CONNECTOR = None
+
+
 async def execute_single_gql_query(
     subgraph_url: str, query: DocumentNode, variables: Dict
 ):
-    transport = AIOHTTPTransport(url=subgraph_url)
-    async with Client(transport=transport, execute_timeout=EXECUTE_TIMEOUT) as session:
-        return await session.execute(query, variable_values=variables)
+    session = await get_gql_session(subgraph_url)
+    return await session.execute(query, variable_values=variables)
 
 
 async def execute_sw_gql_query(
@@ -64,11 +167,10 @@ async def execute_uniswap_v3_gql_query(
     )
 
 
-async def _execute_base_gql_paginated_query(
+async def _iterate_base_gql_paginated_query(
     subgraph_urls: str, query: DocumentNode, variables: Dict, paginated_field: str
-) -> List:
-    """Executes GraphQL query."""
-    result: List[Any] = []
+) -> AsyncIterator[List]:
+    """Executes GraphQL query and yields the chunks as they are fetched."""
     variables["last_id"] = ""
 
     while True:
@@ -78,13 +180,40 @@ async def _execute_base_gql_paginated_query(
             variables=variables,
         )
         chunks = query_result.get(paginated_field, [])
-        result.extend(chunks)
+        yield chunks
         if len(chunks) < PAGINATION_WINDOWS:
-            return result
+            return
 
         variables["last_id"] = chunks[-1]["id"]
 
 
+async def _execute_base_gql_paginated_query(
+    subgraph_urls: str, query: DocumentNode, variables: Dict, paginated_field: str
+) -> List:
+    """Executes GraphQL query."""
+    result: List[Any] = []
+    async for chunks in _iterate_base_gql_paginated_query(
+        subgraph_urls=subgraph_urls,
+        query=query,
+        variables=variables,
+        paginated_field=paginated_field,
+    ):
+        result.extend(chunks)
+
+    return result
+
+
+def iterate_sw_gql_paginated_query(
+    network: str, query: DocumentNode, variables: Dict, paginated_field: str
+) -> AsyncIterator[List]:
+    return _iterate_base_gql_paginated_query(
+        subgraph_urls=get_network_config(network)["STAKEWISE_SUBGRAPH_URLS"],
+        query=query,
+        variables=variables,
+        paginated_field=paginated_field,
+    )
+
+
 async def execute_sw_gql_paginated_query(
     network: str, query: DocumentNode, variables: Dict, paginated_field: str
 ) -> List:
@@ -108,7 +237,14 @@ async def execute_uniswap_v3_paginated_gql_query(
     )
 
 
-@backoff.on_exception(backoff.expo, Exception, max_time=300, logger=gql_logger)
+@backoff.on_exception(
+    backoff.expo,
+    Exception,
+    max_time=300,
+    max_tries=8,
+    giveup=is_non_transient_error,
+    logger=gql_logger,
+)
 async def execute_gql_query(
     subgraph_urls: str, query: DocumentNode, variables: Dict
 ) -> List:
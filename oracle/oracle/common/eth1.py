@@ -35,17 +35,17 @@ def get_web3_client() -> Web3:
     # Prefer WS over HTTP
     if endpoint.startswith("ws"):
         w3 = Web3(Web3.WebsocketProvider(endpoint, websocket_timeout=60))
-        logger.warning(f"Web3 websocket endpoint={endpoint}")
+        logger.info(f"Web3 websocket endpoint={endpoint}")
     elif endpoint.startswith("http"):
         w3 = Web3(Web3.HTTPProvider(endpoint))
-        logger.warning(f"Web3 HTTP endpoint={endpoint}")
+        logger.info(f"Web3 HTTP endpoint={endpoint}")
     else:
         w3 = Web3(Web3.IPCProvider(endpoint))
-        logger.warning(f"Web3 HTTP endpoint={endpoint}")
+        logger.info(f"Web3 HTTP endpoint={endpoint}")
 
     if NETWORK_CONFIG["IS_POA"]:
         w3.middleware_onion.inject(geth_poa_middleware, layer=0)
-        logger.warning("Injected POA middleware")
+        logger.info("Injected POA middleware")
 
     return w3
 
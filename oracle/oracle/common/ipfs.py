@@ -1,10 +1,14 @@
+import asyncio
 import logging
+import threading
 from typing import Any, Dict, List, Union
 
 import backoff
 import ipfshttpclient
-from aiohttp import ClientSession, ClientTimeout
+import orjson
+from aiohttp import ClientTimeout
 
+from oracle.oracle.common.clients import get_aiohttp_session
 from oracle.oracle.utils import LimitedSizeDict
 from oracle.settings import (
     INFURA_IPFS_CLIENT_ENDPOINT,
@@ -21,43 +25,118 @@ timeout = ClientTimeout(total=180)
 CACHE_SIZE = 1024
 IPFS_CACHE = LimitedSizeDict(size_limit=CACHE_SIZE)
 
+# the last endpoint that has successfully responded is tried first
+IPFS_ENDPOINTS: List[str] = list(IPFS_FETCH_ENDPOINTS)
+
+# IPFS clients with persistent sessions, used from the worker threads
+IPFS_CLIENTS: Dict[str, ipfshttpclient.Client] = {}
+IPFS_CLIENTS_LOCK = threading.Lock()
+
+
+def get_ipfs_client(endpoint: str, **kwargs) -> ipfshttpclient.Client:
+    """Returns IPFS client connected to the endpoint."""
+    with IPFS_CLIENTS_LOCK:
+        client = IPFS_CLIENTS.get(endpoint)
+        if client is None:
+            client = ipfshttpclient.connect(endpoint, session=True, **kwargs)
+            IPFS_CLIENTS[endpoint] = client
+
+    return client
+
+
+def evict_ipfs_client(
+    endpoint: str, client: Union[ipfshttpclient.Client, None] = None
+) -> None:
+    """
+    Closes IPFS client so that the next call reconnects to the endpoint.
+    If the failed client is passed, it's closed only if it's still registered,
+    so that the client reconnected by another thread isn't closed.
+    """
+    with IPFS_CLIENTS_LOCK:
+        registered = IPFS_CLIENTS.get(endpoint)
+        if registered is None or (client is not None and registered is not client):
+            return
+        del IPFS_CLIENTS[endpoint]
+
+    try:
+        registered.close()
+    except Exception as e:
+        logger.exception(e)
+
+
+def get_ipfs_json(endpoint: str, ipfs_hash: str, **kwargs) -> Any:
+    """Fetches JSON from the IPFS node, reconnects on the next call if it fails."""
+    client = get_ipfs_client(endpoint, **kwargs)
+    try:
+        return client.get_json(ipfs_hash)
+    except Exception:
+        evict_ipfs_client(endpoint, client)
+        raise
+
+
+def close_ipfs_clients() -> None:
+    """Closes all the IPFS clients."""
+    for endpoint in list(IPFS_CLIENTS):
+        evict_ipfs_client(endpoint)
+
+
+def remove_ipfs_prefix(ipfs_id: str) -> str:
+    if ipfs_id.startswith("ipfs://"):
+        ipfs_id = ipfs_id[len("ipfs://") :]
+
+    if ipfs_id.startswith("/ipfs/"):
+        ipfs_id = ipfs_id[len("/ipfs/") :]
+
+    return ipfs_id
+
 
 @backoff.on_exception(backoff.expo, Exception, max_time=900)
 async def ipfs_fetch(ipfs_hash: str) -> Union[Dict[Any, Any], List[Dict[Any, Any]]]:
     """Tries to fetch IPFS hash from different sources."""
-    _ipfs_hash = ipfs_hash.replace("ipfs://", "").replace("/ipfs/", "")
+    _ipfs_hash = remove_ipfs_prefix(ipfs_hash)
 
-    if IPFS_CACHE.get(_ipfs_hash):
-        return IPFS_CACHE.get(_ipfs_hash)
+    data = IPFS_CACHE.get(_ipfs_hash)
+    if data:
+        return data
 
     async def _fetch(_ipfs_hash):
-        async with ClientSession(timeout=timeout) as session:
-            for endpoint in IPFS_FETCH_ENDPOINTS:
-                try:
-                    response = await session.get(
-                        f"{endpoint.rstrip('/')}/ipfs/{_ipfs_hash}"
-                    )
+        session = get_aiohttp_session()
+        for endpoint in list(IPFS_ENDPOINTS):
+            try:
+                async with session.get(
+                    f"{endpoint.rstrip('/')}/ipfs/{_ipfs_hash}", timeout=timeout
+                ) as response:
                     response.raise_for_status()
-                    return await response.json()
-                except BaseException as e:  # noqa: E722
-                    logger.exception(e)
+                    # parse raw bytes to avoid decoding the whole document to str
+                    data = orjson.loads(await response.read())
+            except Exception as e:
+                logger.exception(e)
+                continue
+
+            if IPFS_ENDPOINTS[0] != endpoint:
+                IPFS_ENDPOINTS.remove(endpoint)
+                IPFS_ENDPOINTS.insert(0, endpoint)
+            return data
 
+        # IPFS clients are blocking, fetch from them outside of the event loop
         if LOCAL_IPFS_CLIENT_ENDPOINT:
             try:
-                with ipfshttpclient.connect(LOCAL_IPFS_CLIENT_ENDPOINT) as client:
-                    return client.get_json(_ipfs_hash)
-            except BaseException as e:  # noqa: E722
+                return await asyncio.to_thread(
+                    get_ipfs_json, LOCAL_IPFS_CLIENT_ENDPOINT, _ipfs_hash
+                )
+            except Exception as e:
                 logger.exception(e)
 
         try:
-            with ipfshttpclient.connect(
+            return await asyncio.to_thread(
+                get_ipfs_json,
                 INFURA_IPFS_CLIENT_ENDPOINT,
+                _ipfs_hash,
                 username=INFURA_IPFS_CLIENT_USERNAME,
                 password=INFURA_IPFS_CLIENT_PASSWORD,
                 timeout=180,
-            ) as client:
-                return client.get_json(_ipfs_hash)
-        except BaseException as e:  # noqa: E722
+            )
+        except Exception as e:
             logger.exception(e)
 
     data = await _fetch(_ipfs_hash)
@@ -1,8 +1,8 @@
+from collections import defaultdict
 from typing import Dict, List, Set
 
 from ens.constants import EMPTY_ADDR_HEX
 from eth_typing import BlockNumber, ChecksumAddress
-from web3 import Web3
 
 from oracle.oracle.common.clients import execute_sw_gql_paginated_query
 from oracle.oracle.common.graphql_queries import (
@@ -11,6 +11,7 @@ from oracle.oracle.common.graphql_queries import (
     DISTRIBUTOR_TOKENS_QUERY,
 )
 from oracle.oracle.distributor.common.types import Balances
+from oracle.oracle.utils import to_checksum_address
 
 
 async def get_distributor_redirects(
@@ -29,8 +30,8 @@ async def get_distributor_redirects(
 
     redirects: Dict[ChecksumAddress, ChecksumAddress] = {}
     for redirect in distributor_redirects:
-        redirected_from = Web3.toChecksumAddress(redirect["id"])
-        redirected_to = Web3.toChecksumAddress(redirect["token"]["id"])
+        redirected_from = to_checksum_address(redirect["id"])
+        redirected_to = to_checksum_address(redirect["token"]["id"])
         redirects[redirected_from] = redirected_to
 
     return redirects
@@ -49,7 +50,7 @@ async def get_distributor_tokens(
         paginated_field="distributorTokens",
     )
 
-    return set(Web3.toChecksumAddress(t["id"]) for t in distributor_tokens)
+    return {to_checksum_address(t["id"]) for t in distributor_tokens}
 
 
 async def get_token_liquidity_points(
@@ -71,27 +72,27 @@ async def get_token_liquidity_points(
     )
 
     # process balances
-    points: Dict[ChecksumAddress, int] = {}
+    points: Dict[ChecksumAddress, int] = defaultdict(int)
     total_points = 0
     for position in positions:
-        account = Web3.toChecksumAddress(position["account"])
+        account = to_checksum_address(position["account"])
         if account == EMPTY_ADDR_HEX:
             continue
 
-        principal = int(position["amount"])
-        prev_account_points = int(position["distributorPoints"])
-        updated_at_block = BlockNumber(int(position["updatedAtBlock"]))
+        updated_at_block = int(position["updatedAtBlock"])
         if from_block > updated_at_block:
             updated_at_block = from_block
             prev_account_points = 0
+        else:
+            prev_account_points = int(position["distributorPoints"])
 
         account_points = prev_account_points + (
-            principal * (to_block - updated_at_block)
+            int(position["amount"]) * (to_block - updated_at_block)
         )
         if account_points <= 0:
             continue
 
-        points[account] = points.get(account, 0) + account_points
+        points[account] += account_points
         total_points += account_points
 
-    return Balances(total_supply=total_points, balances=points)
+    return Balances(total_supply=total_points, balances=dict(points))
@@ -1,14 +1,15 @@
 import logging
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from typing import Dict, List, Tuple, Union
 
 from ens.constants import EMPTY_ADDR_HEX
 from eth_typing import ChecksumAddress, HexStr
-from web3 import Web3
 from web3.types import BlockNumber, Wei
 
 from oracle.oracle.common.clients import (
     execute_sw_gql_paginated_query,
     execute_sw_gql_query,
+    iterate_sw_gql_paginated_query,
 )
 from oracle.oracle.common.graphql_queries import (
     DISABLED_STAKER_ACCOUNTS_QUERY,
@@ -26,6 +27,7 @@ from oracle.oracle.distributor.common.types import (
     TokenAllocations,
 )
 from oracle.oracle.distributor.rewards import DistributorRewards
+from oracle.oracle.utils import to_checksum_address
 
 logger = logging.getLogger(__name__)
 
@@ -34,33 +36,30 @@ async def get_periodic_allocations(
     network: str, from_block: BlockNumber, to_block: BlockNumber
 ) -> TokenAllocations:
     """Fetches periodic allocations."""
-    distributions: List = await execute_sw_gql_paginated_query(
+    allocations: TokenAllocations = defaultdict(list)
+    async for distributions in iterate_sw_gql_paginated_query(
         network=network,
         query=PERIODIC_DISTRIBUTIONS_QUERY,
         variables=dict(from_block=from_block, to_block=to_block),
         paginated_field="periodicDistributions",
-    )
-
-    allocations: TokenAllocations = {}
-    for dist in distributions:
-        dist_start_block: BlockNumber = BlockNumber(int(dist["startedAtBlock"]))
-        dist_end_block: BlockNumber = BlockNumber(int(dist["endedAtBlock"]))
-
-        if dist_end_block <= from_block or dist_start_block >= to_block:
-            # distributions are out of current range
-            continue
-
-        allocation = TokenAllocation(
-            from_block=dist_start_block,
-            to_block=dist_end_block,
-            reward_token=Web3.toChecksumAddress(dist["token"]),
-            reward=int(dist["amount"]),
-        )
-        allocations.setdefault(Web3.toChecksumAddress(dist["beneficiary"]), []).append(
-            allocation
-        )
+    ):
+        for dist in distributions:
+            dist_start_block: BlockNumber = BlockNumber(int(dist["startedAtBlock"]))
+            dist_end_block: BlockNumber = BlockNumber(int(dist["endedAtBlock"]))
+
+            if dist_end_block <= from_block or dist_start_block >= to_block:
+                # distributions are out of current range
+                continue
+
+            allocation = TokenAllocation(
+                from_block=dist_start_block,
+                to_block=dist_end_block,
+                reward_token=to_checksum_address(dist["token"]),
+                reward=int(dist["amount"]),
+            )
+            allocations[to_checksum_address(dist["beneficiary"])].append(allocation)
 
-    return allocations
+    return dict(allocations)
 
 
 async def get_disabled_stakers_reward_token_distributions(
@@ -75,88 +74,77 @@ async def get_disabled_stakers_reward_token_distributions(
     if distributor_reward <= 0:
         return []
 
+    # filter valid stakers and calculate total distributor principal page by page
+    reward_per_token: Union[Wei, None] = None
+    distributor_principal = Wei(0)
+    principals: List[Tuple[ChecksumAddress, Wei]] = []
     last_id = ""
-    result: Dict = await execute_sw_gql_query(
-        network=network,
-        query=DISABLED_STAKER_ACCOUNTS_QUERY,
-        variables=dict(block_number=to_block, last_id=last_id),
-    )
-    stakers_chunk = result.get("stakers", [])
-    stakers = stakers_chunk
-
-    # accumulate chunks of validators
-    while len(stakers_chunk) >= 1000:
-        last_id = stakers_chunk[-1]["id"]
-        result_stakers: Dict = await execute_sw_gql_query(
+    while True:
+        result: Dict = await execute_sw_gql_query(
             network=network,
             query=DISABLED_STAKER_ACCOUNTS_QUERY,
             variables=dict(block_number=to_block, last_id=last_id),
         )
-        stakers_chunk = result_stakers.get("stakers", [])
-        stakers.extend(stakers_chunk)
+        if reward_per_token is None:
+            reward_per_token = Wei(
+                int(result["rewardEthTokens"][0]["rewardPerStakedEthToken"])
+            )
 
-    reward_per_token: Wei = Wei(
-        int(result["rewardEthTokens"][0]["rewardPerStakedEthToken"])
-    )
+        stakers_chunk = result.get("stakers", [])
+        for staker in stakers_chunk:
+            staker_reward_per_token: Wei = Wei(int(staker["rewardPerStakedEthToken"]))
+            staker_address: ChecksumAddress = to_checksum_address(staker["id"])
+            staker_principal: Wei = Wei(int(staker["principalBalance"]))
+            if staker_reward_per_token >= reward_per_token or staker_principal <= 0:
+                continue
 
-    # filter valid stakers and calculated total distributor principal
-    distributor_principal = Wei(0)
-    principals: Dict[ChecksumAddress, Wei] = {}
-    for staker in stakers:
-        staker_reward_per_token: Wei = Wei(int(staker["rewardPerStakedEthToken"]))
-        staker_address: ChecksumAddress = Web3.toChecksumAddress(staker["id"])
-        staker_principal: Wei = Wei(int(staker["principalBalance"]))
-        if staker_reward_per_token >= reward_per_token or staker_principal <= 0:
-            continue
+            principals.append((staker_address, staker_principal))
+            distributor_principal += Wei(staker_principal)
 
-        principals[staker_address] = staker_principal
-        distributor_principal += Wei(staker_principal)
+        if len(stakers_chunk) < 1000:
+            break
+
+        last_id = stakers_chunk[-1]["id"]
 
     if distributor_principal <= 0:
         return []
 
-    # create distributions
-    distributions: Distributions = []
-    distributed: Wei = Wei(0)
-    last_staker_index = len(principals) - 1
-    for i, staker_address in enumerate(principals):
-        reward: Wei
-        if i == last_staker_index:
-            reward = Wei(distributor_reward - distributed)
-        else:
-            reward = Wei(
-                (distributor_reward * principals[staker_address])
-                // distributor_principal
-            )
-
-        if reward <= 0:
-            continue
+    # calculate proportional rewards, the last staker receives the leftovers
+    staker_rewards: List[int] = [
+        (distributor_reward * staker_principal) // distributor_principal
+        for _, staker_principal in principals
+    ]
+    staker_rewards[-1] = distributor_reward - sum(staker_rewards[:-1])
 
-        distribution = Distribution(
+    # create distributions
+    return [
+        Distribution(
             contract=staker_address,
             from_block=from_block,
             to_block=to_block,
             uni_v3_token=staked_token_address,
             reward_token=reward_token_address,
-            reward=reward,
+            reward=Wei(reward),
         )
-        distributions.append(distribution)
-        distributed += Wei(reward)
-
-    return distributions
+        for (staker_address, _), reward in zip(principals, staker_rewards)
+        if reward > 0
+    ]
 
 
 async def get_distributor_claimed_accounts(
     network: str, merkle_root: HexStr
 ) -> ClaimedAccounts:
     """Fetches addresses that have claimed their tokens from the `MerkleDistributor` contract."""
-    claims: List = await execute_sw_gql_paginated_query(
+    claimed_accounts: ClaimedAccounts = set()
+    async for claims in iterate_sw_gql_paginated_query(
         network=network,
         query=DISTRIBUTOR_CLAIMED_ACCOUNTS_QUERY,
         variables=dict(merkle_root=merkle_root),
         paginated_field="merkleDistributorClaims",
-    )
-    return set(Web3.toChecksumAddress(claim["account"]) for claim in claims)
+    ):
+        claimed_accounts |= {to_checksum_address(c["account"]) for c in claims}
+
+    return claimed_accounts
 
 
 async def get_operators_rewards(
@@ -211,7 +199,7 @@ async def get_one_time_rewards(
 
         total_amount = int(distribution["amount"])
         distributed_amount = 0
-        token = Web3.toChecksumAddress(distribution["token"])
+        token = to_checksum_address(distribution["token"])
         rewards: Rewards = {}
         try:
             allocated_rewards = await get_one_time_rewards_allocations(
@@ -236,6 +224,6 @@ async def get_one_time_rewards(
             )
             rewards = {distributor_fallback_address: {token: str(total_amount)}}
 
-        final_rewards = DistributorRewards.merge_rewards(final_rewards, rewards)
+        DistributorRewards.merge_rewards_inplace(final_rewards, rewards)
 
     return final_rewards
@@ -1,15 +1,16 @@
+from collections import defaultdict
 from math import ceil
 from typing import Dict, List
 
 import backoff
 from ens.constants import EMPTY_ADDR_HEX
 from eth_typing import BlockNumber, ChecksumAddress
-from web3 import Web3
 
 from oracle.networks import GNOSIS_CHAIN, HARBOUR_GOERLI, HARBOUR_MAINNET
 from oracle.oracle.common.clients import (
     execute_uniswap_v3_gql_query,
     execute_uniswap_v3_paginated_gql_query,
+    is_non_transient_error,
 )
 from oracle.oracle.common.graphql_queries import (
     UNISWAP_V3_CURRENT_TICK_POSITIONS_QUERY,
@@ -25,6 +26,7 @@ from oracle.oracle.distributor.common.types import (
     TokenAllocations,
     UniswapV3Pools,
 )
+from oracle.oracle.utils import to_checksum_address
 
 # NB! Changing BLOCKS_INTERVAL while distributions are still active can lead to invalid allocations
 BLOCKS_INTERVAL: BlockNumber = BlockNumber(277)
@@ -35,7 +37,13 @@ Q32 = 2**32
 Q96 = 2**96
 
 
-@backoff.on_exception(backoff.expo, Exception, max_time=900)
+@backoff.on_exception(
+    backoff.expo,
+    Exception,
+    max_time=900,
+    max_tries=8,
+    giveup=is_non_transient_error,
+)
 async def get_uniswap_v3_pools(
     network: str,
     block_number: BlockNumber,
@@ -64,9 +72,9 @@ async def get_uniswap_v3_pools(
         swise_pools=set(),
     )
     for pool in pools:
-        pool_address = Web3.toChecksumAddress(pool["id"])
-        pool_token0 = Web3.toChecksumAddress(pool["token0"])
-        pool_token1 = Web3.toChecksumAddress(pool["token1"])
+        pool_address = to_checksum_address(pool["id"])
+        pool_token0 = to_checksum_address(pool["token0"])
+        pool_token1 = to_checksum_address(pool["token1"])
         for pool_token in [pool_token0, pool_token1]:
             if pool_token == staked_token_address:
                 uni_v3_pools["staked_token_pools"].add(pool_address)
@@ -149,7 +157,13 @@ async def get_uniswap_v3_distributions(
     return distributions
 
 
-@backoff.on_exception(backoff.expo, Exception, max_time=900)
+@backoff.on_exception(
+    backoff.expo,
+    Exception,
+    max_time=900,
+    max_tries=8,
+    giveup=is_non_transient_error,
+)
 async def get_uniswap_v3_liquidity_points(
     network: str, pool_address: ChecksumAddress, block_number: BlockNumber
 ) -> Balances:
@@ -182,10 +196,10 @@ async def get_uniswap_v3_liquidity_points(
     )
 
     # process positions
-    balances: Dict[ChecksumAddress, int] = {}
+    balances: Dict[ChecksumAddress, int] = defaultdict(int)
     total_supply = 0
     for position in positions:
-        account = Web3.toChecksumAddress(position["owner"])
+        account = to_checksum_address(position["owner"])
         if account == EMPTY_ADDR_HEX:
             continue
 
@@ -193,14 +207,20 @@ async def get_uniswap_v3_liquidity_points(
         if liquidity <= 0:
             continue
 
-        balances[account] = balances.setdefault(account, 0) + liquidity
+        balances[account] += liquidity
 
         total_supply += liquidity
 
-    return Balances(total_supply=total_supply, balances=balances)
+    return Balances(total_supply=total_supply, balances=dict(balances))
 
 
-@backoff.on_exception(backoff.expo, Exception, max_time=900)
+@backoff.on_exception(
+    backoff.expo,
+    Exception,
+    max_time=900,
+    max_tries=8,
+    giveup=is_non_transient_error,
+)
 async def get_uniswap_v3_range_liquidity_points(
     network: str,
     tick_lower: int,
@@ -224,10 +244,10 @@ async def get_uniswap_v3_range_liquidity_points(
     )
 
     # process positions
-    balances: Dict[ChecksumAddress, int] = {}
+    balances: Dict[ChecksumAddress, int] = defaultdict(int)
     total_supply = 0
     for position in positions:
-        account = Web3.toChecksumAddress(position["owner"])
+        account = to_checksum_address(position["owner"])
         if account == EMPTY_ADDR_HEX:
             continue
 
@@ -235,14 +255,20 @@ async def get_uniswap_v3_range_liquidity_points(
         if liquidity <= 0:
             continue
 
-        balances[account] = balances.setdefault(account, 0) + liquidity
+        balances[account] += liquidity
 
         total_supply += liquidity
 
-    return Balances(total_supply=total_supply, balances=balances)
+    return Balances(total_supply=total_supply, balances=dict(balances))
 
 
-@backoff.on_exception(backoff.expo, Exception, max_time=900)
+@backoff.on_exception(
+    backoff.expo,
+    Exception,
+    max_time=900,
+    max_tries=8,
+    giveup=is_non_transient_error,
+)
 async def get_uniswap_v3_single_token_balances(
     network: str,
     pool_address: ChecksumAddress,
@@ -271,8 +297,8 @@ async def get_uniswap_v3_single_token_balances(
         return Balances(total_supply=0, balances={})
     sqrt_price = int(sqrt_price)
 
-    token0_address: ChecksumAddress = Web3.toChecksumAddress(pool["token0"])
-    token1_address: ChecksumAddress = Web3.toChecksumAddress(pool["token1"])
+    token0_address: ChecksumAddress = to_checksum_address(pool["token0"])
+    token1_address: ChecksumAddress = to_checksum_address(pool["token1"])
 
     positions: List = await execute_uniswap_v3_paginated_gql_query(
         network=network,
@@ -286,10 +312,10 @@ async def get_uniswap_v3_single_token_balances(
 
     # TODO: calculated earned fees
     # process positions
-    balances: Dict[ChecksumAddress, int] = {}
+    balances: Dict[ChecksumAddress, int] = defaultdict(int)
     total_supply = 0
     for position in positions:
-        account = Web3.toChecksumAddress(position["owner"])
+        account = to_checksum_address(position["owner"])
         if account == EMPTY_ADDR_HEX:
             continue
 
@@ -311,7 +337,7 @@ async def get_uniswap_v3_single_token_balances(
                 tick_upper=tick_upper,
                 liquidity=liquidity,
             )
-            balances[account] = balances.setdefault(account, 0) + token0_amount
+            balances[account] += token0_amount
             total_supply += token0_amount
         elif token1_address == token:
             token1_amount = _get_amount1(
@@ -322,10 +348,10 @@ async def get_uniswap_v3_single_token_balances(
                 liquidity=liquidity,
             )
 
-            balances[account] = balances.setdefault(account, 0) + token1_amount
+            balances[account] += token1_amount
             total_supply += token1_amount
 
-    return Balances(total_supply=total_supply, balances=balances)
+    return Balances(total_supply=total_supply, balances=dict(balances))
 
 
 def get_amount0(
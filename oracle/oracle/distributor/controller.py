@@ -1,8 +1,12 @@
 import asyncio
+import hashlib
+import itertools
 import logging
+from typing import Union
 
+import orjson
 from eth_account.signers.local import LocalAccount
-from eth_typing import HexStr
+from eth_typing import BlockNumber, HexStr
 from web3 import Web3
 
 from oracle.oracle.distributor.common.distributor_tokens import (
@@ -21,12 +25,14 @@ from oracle.oracle.distributor.common.types import (
     DistributorVote,
     DistributorVotingParameters,
     Rewards,
+    TokenAllocations,
+    UniswapV3Pools,
 )
 from oracle.oracle.distributor.common.uniswap_v3 import (
     get_uniswap_v3_distributions,
     get_uniswap_v3_pools,
 )
-from oracle.oracle.utils import save
+from oracle.oracle.utils import LimitedSizeDict, save
 from oracle.oracle.vote import submit_vote
 from oracle.settings import DISTRIBUTOR_VOTE_FILENAME, NETWORK, NETWORK_CONFIG
 
@@ -36,6 +42,8 @@ from .rewards import DistributorRewards
 logger = logging.getLogger(__name__)
 w3 = Web3()
 
+CACHE_SIZE = 8
+
 
 class DistributorController(object):
     """Updates merkle root and submits proofs to the IPFS."""
@@ -49,6 +57,62 @@ class DistributorController(object):
         self.reward_token_contract_address = NETWORK_CONFIG[
             "REWARD_TOKEN_CONTRACT_ADDRESS"
         ]
+        self.periodic_allocations_cache = LimitedSizeDict(size_limit=CACHE_SIZE)
+        self.uniswap_v3_pools_cache = LimitedSizeDict(size_limit=CACHE_SIZE)
+        self.merkle_cache = LimitedSizeDict(size_limit=CACHE_SIZE)
+
+    async def get_periodic_allocations(
+        self, from_block: BlockNumber, to_block: BlockNumber
+    ) -> TokenAllocations:
+        """Fetches periodic allocations for the blocks range or returns them from the cache."""
+        key = (from_block, to_block)
+        allocations = self.periodic_allocations_cache.get(key)
+        if allocations is None:
+            allocations = await get_periodic_allocations(
+                network=NETWORK, from_block=from_block, to_block=to_block
+            )
+            self.periodic_allocations_cache[key] = allocations
+
+        return allocations
+
+    async def get_uniswap_v3_pools(self, to_block: BlockNumber) -> UniswapV3Pools:
+        """Fetches Uniswap V3 pools at the block or returns them from the cache."""
+        uniswap_v3_pools = self.uniswap_v3_pools_cache.get(to_block)
+        if uniswap_v3_pools is None:
+            uniswap_v3_pools = await get_uniswap_v3_pools(
+                network=NETWORK,
+                block_number=to_block,
+                reward_token_address=NETWORK_CONFIG["REWARD_TOKEN_CONTRACT_ADDRESS"],
+                staked_token_address=NETWORK_CONFIG["STAKED_TOKEN_CONTRACT_ADDRESS"],
+                swise_token_address=NETWORK_CONFIG["SWISE_TOKEN_CONTRACT_ADDRESS"],
+            )
+            self.uniswap_v3_pools_cache[to_block] = uniswap_v3_pools
+
+        return uniswap_v3_pools
+
+    async def get_unclaimed_rewards(
+        self,
+        last_merkle_root: Union[HexStr, None],
+        last_merkle_proofs: Union[str, None],
+    ) -> Rewards:
+        """Fetches rewards that were not claimed since the last merkle root update."""
+        if (
+            last_merkle_root is None
+            or not w3.toInt(hexstr=last_merkle_root)
+            or not last_merkle_proofs
+        ):
+            return {}
+
+        # fetch accounts that have claimed since last merkle root update
+        claimed_accounts = await get_distributor_claimed_accounts(
+            network=NETWORK, merkle_root=last_merkle_root
+        )
+
+        # calculate unclaimed rewards
+        return await get_unclaimed_balances(
+            claimed_accounts=claimed_accounts,
+            merkle_proofs=last_merkle_proofs,
+        )
 
     @save
     async def process(self, voting_params: DistributorVotingParameters) -> None:
@@ -70,16 +134,31 @@ class DistributorController(object):
             f"Voting for Merkle Distributor rewards: from block={from_block}, to block={to_block}"
         )
 
-        # fetch active periodic allocations
-        active_allocations = await get_periodic_allocations(
-            network=NETWORK, from_block=from_block, to_block=to_block
-        )
-        uniswap_v3_pools = await get_uniswap_v3_pools(
-            network=NETWORK,
-            block_number=to_block,
-            reward_token_address=NETWORK_CONFIG["REWARD_TOKEN_CONTRACT_ADDRESS"],
-            staked_token_address=NETWORK_CONFIG["STAKED_TOKEN_CONTRACT_ADDRESS"],
-            swise_token_address=NETWORK_CONFIG["SWISE_TOKEN_CONTRACT_ADDRESS"],
+        # fetch allocations, pools, distributor tokens and unclaimed rewards concurrently
+        (
+            active_allocations,
+            uniswap_v3_pools,
+            disabled_stakers_distributions,
+            distributor_tokens,
+            distributor_redirects,
+            unclaimed_rewards,
+        ) = await asyncio.gather(
+            self.get_periodic_allocations(from_block, to_block),
+            self.get_uniswap_v3_pools(to_block),
+            get_disabled_stakers_reward_token_distributions(
+                network=NETWORK,
+                distributor_reward=voting_params["distributor_reward"],
+                from_block=from_block,
+                to_block=to_block,
+                reward_token_address=NETWORK_CONFIG["REWARD_TOKEN_CONTRACT_ADDRESS"],
+                staked_token_address=NETWORK_CONFIG["STAKED_TOKEN_CONTRACT_ADDRESS"],
+            ),
+            get_distributor_tokens(NETWORK, from_block),
+            get_distributor_redirects(NETWORK, from_block),
+            self.get_unclaimed_rewards(
+                last_merkle_root=voting_params["last_merkle_root"],
+                last_merkle_proofs=voting_params["last_merkle_proofs"],
+            ),
         )
 
         # fetch uni v3 distributions
@@ -89,44 +168,10 @@ class DistributorController(object):
             from_block=from_block,
             to_block=to_block,
         )
-
-        # fetch disabled stakers distributions
-        disabled_stakers_distributions = (
-            await get_disabled_stakers_reward_token_distributions(
-                network=NETWORK,
-                distributor_reward=voting_params["distributor_reward"],
-                from_block=from_block,
-                to_block=to_block,
-                reward_token_address=NETWORK_CONFIG["REWARD_TOKEN_CONTRACT_ADDRESS"],
-                staked_token_address=NETWORK_CONFIG["STAKED_TOKEN_CONTRACT_ADDRESS"],
-            )
-        )
         all_distributions.extend(disabled_stakers_distributions)
 
-        last_merkle_root = voting_params["last_merkle_root"]
-        last_merkle_proofs = voting_params["last_merkle_proofs"]
-        if (
-            last_merkle_root is not None
-            and w3.toInt(hexstr=last_merkle_root)
-            and last_merkle_proofs
-        ):
-            # fetch accounts that have claimed since last merkle root update
-            claimed_accounts = await get_distributor_claimed_accounts(
-                network=NETWORK, merkle_root=last_merkle_root
-            )
-
-            # calculate unclaimed rewards
-            unclaimed_rewards = await get_unclaimed_balances(
-                claimed_accounts=claimed_accounts,
-                merkle_proofs=last_merkle_proofs,
-            )
-        else:
-            unclaimed_rewards = {}
-
         # calculate reward distributions with coroutines
         tasks = []
-        distributor_tokens = await get_distributor_tokens(NETWORK, from_block)
-        distributor_redirects = await get_distributor_redirects(NETWORK, from_block)
         for dist in all_distributions:
             distributor_rewards = DistributorRewards(
                 uniswap_v3_pools=uniswap_v3_pools,
@@ -154,11 +199,7 @@ class DistributorController(object):
             )
         )
 
-        # merge results
         results = await asyncio.gather(*tasks)
-        final_rewards: Rewards = {}
-        for rewards in results:
-            final_rewards = DistributorRewards.merge_rewards(final_rewards, rewards)
 
         protocol_reward = voting_params["protocol_reward"]
         operators_rewards, left_reward = await get_operators_rewards(
@@ -167,36 +208,43 @@ class DistributorController(object):
             operator_address=NETWORK_CONFIG["OPERATOR_ADDRESS"],
         )
 
+        fallback_rewards: Rewards = {}
         if left_reward > 0:
-            fallback_rewards: Rewards = {
+            fallback_rewards = {
                 self.distributor_fallback_address: {
                     self.reward_token_contract_address: str(left_reward)
                 }
             }
-            final_rewards = DistributorRewards.merge_rewards(
-                rewards1=final_rewards,
-                rewards2=fallback_rewards,
-            )
 
-        for rewards in [operators_rewards]:
-            final_rewards = DistributorRewards.merge_rewards(final_rewards, rewards)
-
-        # merge final rewards with unclaimed rewards
-        if unclaimed_rewards:
-            final_rewards = DistributorRewards.merge_rewards(
-                final_rewards, unclaimed_rewards
-            )
+        # merge results with operators and unclaimed rewards in a single pass
+        final_rewards: Rewards = {}
+        for rewards in itertools.chain(
+            results, [fallback_rewards, operators_rewards, unclaimed_rewards]
+        ):
+            DistributorRewards.merge_rewards_inplace(final_rewards, rewards)
 
         if not final_rewards:
             logger.info("No rewards to distribute")
             return
 
-        # calculate merkle root
-        merkle_root, claims = calculate_merkle_root(final_rewards)
-        logger.info(f"Generated new merkle root: {merkle_root}")
+        # reuse merkle root and claims link if the rewards haven't changed
+        rewards_key = hashlib.blake2b(
+            orjson.dumps(final_rewards, option=orjson.OPT_SORT_KEYS)
+        ).digest()
+        if rewards_key in self.merkle_cache:
+            merkle_root, claims_link = self.merkle_cache[rewards_key]
+            logger.info(f"Reusing merkle root: {merkle_root}, claims: {claims_link}")
+        else:
+            # calculate merkle root
+            # merkle tree hashing is CPU heavy, calculate it outside of the event loop
+            merkle_root, claims = await asyncio.to_thread(
+                calculate_merkle_root, final_rewards
+            )
+            logger.info(f"Generated new merkle root: {merkle_root}")
 
-        claims_link = await upload_claims(claims)
-        logger.info(f"Claims uploaded to: {claims_link}")
+            claims_link = await upload_claims(claims)
+            logger.info(f"Claims uploaded to: {claims_link}")
+            self.merkle_cache[rewards_key] = (merkle_root, claims_link)
 
         # submit vote
         encoded_data: bytes = w3.codec.encode_abi(
@@ -209,7 +257,9 @@ class DistributorController(object):
             merkle_root=merkle_root,
             merkle_proofs=claims_link,
         )
-        submit_vote(
+        # S3 client is blocking, submit the vote outside of the event loop
+        await asyncio.to_thread(
+            submit_vote,
             oracle=self.oracle,
             encoded_data=encoded_data,
             vote=vote,
@@ -1,11 +1,13 @@
-import json
+import asyncio
 import logging
+from collections import defaultdict
+from typing import Dict, Tuple
 
 import backoff
-import ipfshttpclient
-from aiohttp import ClientSession
+import orjson
 
-from oracle.oracle.common.ipfs import ipfs_fetch
+from oracle.oracle.common.clients import get_aiohttp_session
+from oracle.oracle.common.ipfs import evict_ipfs_client, get_ipfs_client, ipfs_fetch
 from oracle.oracle.distributor.common.types import ClaimedAccounts, Claims, Rewards
 from oracle.settings import (
     INFURA_IPFS_CLIENT_ENDPOINT,
@@ -26,29 +28,23 @@ async def get_unclaimed_balances(
     """Fetches balances of previous merkle drop from IPFS and removes the accounts that have already claimed."""
     prev_claims = await ipfs_fetch(merkle_proofs)
 
-    unclaimed_rewards: Rewards = {}
+    # accumulate integer amounts per (account, token) and format them once
+    unclaimed_amounts: Dict[Tuple[str, str], int] = defaultdict(int)
     for account, claim in prev_claims.items():
         if account in claimed_accounts:
             continue
 
         if "reward_tokens" in claim:
             for i, reward_token in enumerate(claim["reward_tokens"]):
-                for origin, value in zip(claim["origins"][i], claim["values"][i]):
-                    prev_unclaimed = unclaimed_rewards.setdefault(
-                        account, {}
-                    ).setdefault(reward_token, "0")
-                    unclaimed_rewards[account][reward_token] = str(
-                        int(prev_unclaimed) + int(value)
-                    )
+                for _, value in zip(claim["origins"][i], claim["values"][i]):
+                    unclaimed_amounts[(account, reward_token)] += int(value)
         else:
             for i, token in enumerate(claim["tokens"]):
-                value = claim["values"][i]
-                prev_unclaimed = unclaimed_rewards.setdefault(account, {}).setdefault(
-                    token, "0"
-                )
-                unclaimed_rewards[account][token] = str(
-                    int(prev_unclaimed) + int(value)
-                )
+                unclaimed_amounts[(account, token)] += int(claim["values"][i])
+
+    unclaimed_rewards: Rewards = {}
+    for (account, token), amount in unclaimed_amounts.items():
+        unclaimed_rewards.setdefault(account, {})[token] = str(amount)
 
     return unclaimed_rewards
 
@@ -63,51 +59,71 @@ def add_ipfs_prefix(ipfs_id: str) -> str:
     return ipfs_id
 
 
+def upload_claims_to_ipfs_client(endpoint: str, claims: bytes, **kwargs) -> str:
+    """Submits serialized claims to the IPFS node and pins the file."""
+    client = get_ipfs_client(endpoint, **kwargs)
+    try:
+        # pin the file with the same request instead of a separate `pin.add` call
+        ipfs_id = client.add_bytes(claims, opts={"pin": "true"})
+    except Exception:
+        evict_ipfs_client(endpoint, client)
+        raise
+
+    return ipfs_id
+
+
+async def upload_claims_to_pinata(claims: bytes) -> str:
+    """Submits serialized claims to the Pinata pinning service."""
+    headers = {
+        "pinata_api_key": IPFS_PINATA_API_KEY,
+        "pinata_secret_api_key": IPFS_PINATA_SECRET_KEY,
+        "Content-Type": "application/json",
+    }
+    session = get_aiohttp_session()
+    async with session.post(
+        url=IPFS_PINATA_PIN_ENDPOINT,
+        data=b'{"pinataContent":' + claims + b"}",
+        headers=headers,
+    ) as response:
+        response.raise_for_status()
+        response = await response.json()
+        return response["IpfsHash"]
+
+
 @backoff.on_exception(backoff.expo, Exception, max_time=900)
 async def upload_claims(claims: Claims) -> str:
     """Submits claims to the IPFS and pins the file."""
     # TODO: split claims into files up to 1000 entries
-    ipfs_ids = []
-    try:
-        with ipfshttpclient.connect(
+    # serialize claims once the same way as `add_json` does to keep the IPFS hash
+    claims_bytes = orjson.dumps(claims, option=orjson.OPT_SORT_KEYS)
+
+    # IPFS clients are blocking, upload to them outside of the event loop
+    tasks = [
+        asyncio.to_thread(
+            upload_claims_to_ipfs_client,
             INFURA_IPFS_CLIENT_ENDPOINT,
+            claims_bytes,
             username=INFURA_IPFS_CLIENT_USERNAME,
             password=INFURA_IPFS_CLIENT_PASSWORD,
             timeout=180,
-        ) as client:
-            ipfs_id = client.add_json(claims)
-            client.pin.add(ipfs_id)
-            ipfs_ids.append(ipfs_id)
-    except Exception as e:
-        logger.error(e)
-
+        )
+    ]
     if LOCAL_IPFS_CLIENT_ENDPOINT:
-        try:
-            with ipfshttpclient.connect(LOCAL_IPFS_CLIENT_ENDPOINT) as client:
-                ipfs_id = client.add_json(claims)
-                client.pin.add(ipfs_id)
-                ipfs_ids.append(ipfs_id)
-        except Exception as e:
-            logger.error(e)
+        tasks.append(
+            asyncio.to_thread(
+                upload_claims_to_ipfs_client, LOCAL_IPFS_CLIENT_ENDPOINT, claims_bytes
+            )
+        )
 
     if IPFS_PINATA_API_KEY and IPFS_PINATA_SECRET_KEY:
-        headers = {
-            "pinata_api_key": IPFS_PINATA_API_KEY,
-            "pinata_secret_api_key": IPFS_PINATA_SECRET_KEY,
-            "Content-Type": "application/json",
-        }
-        try:
-            async with ClientSession(headers=headers) as session:
-                response = await session.post(
-                    url=IPFS_PINATA_PIN_ENDPOINT,
-                    data=json.dumps({"pinataContent": claims}, sort_keys=True),
-                )
-                response.raise_for_status()
-                response = await response.json()
-                ipfs_id = response["IpfsHash"]
-                ipfs_ids.append(ipfs_id)
-        except Exception as e:  # noqa: E722
-            logger.error(e)
+        tasks.append(upload_claims_to_pinata(claims_bytes))
+
+    ipfs_ids = []
+    for result in await asyncio.gather(*tasks, return_exceptions=True):
+        if isinstance(result, BaseException):
+            logger.error(result)
+        else:
+            ipfs_ids.append(result)
 
     if not ipfs_ids:
         raise RuntimeError("Failed to submit claims to IPFS")
@@ -1,4 +1,3 @@
-import copy
 import logging
 from typing import Dict, List, Set
 
@@ -70,24 +69,23 @@ class DistributorRewards(object):
         amount: int,
     ) -> None:
         """Adds reward token to the beneficiary address."""
-        prev_amount = rewards.setdefault(to, {}).setdefault(reward_token, "0")
-        rewards[to][reward_token] = str(int(prev_amount) + amount)
+        account_rewards = rewards.setdefault(to, {})
+        account_rewards[reward_token] = str(
+            int(account_rewards.get(reward_token, "0")) + amount
+        )
 
     @staticmethod
-    def merge_rewards(rewards1: Rewards, rewards2: Rewards) -> Rewards:
-        """Merges two dictionaries into one."""
-        merged_rewards: Rewards = copy.deepcopy(rewards1)
-        for account, account_rewards in rewards2.items():
+    def merge_rewards_inplace(dst: Rewards, src: Rewards) -> None:
+        """Adds rewards from the source dictionary to the destination one."""
+        for account, account_rewards in src.items():
             for reward_token, value in account_rewards.items():
                 DistributorRewards.add_value(
-                    rewards=merged_rewards,
+                    rewards=dst,
                     to=account,
                     reward_token=reward_token,
                     amount=int(value),
                 )
 
-        return merged_rewards
-
     async def get_rewards(
         self, contract_address: ChecksumAddress, reward: int
     ) -> Rewards:
@@ -254,7 +252,7 @@ class DistributorRewards(object):
                     total_reward=account_reward,
                     visited=visited.union({account}),
                 )
-                rewards = self.merge_rewards(rewards, new_rewards)
+                self.merge_rewards_inplace(rewards, new_rewards)
             else:
                 self.add_value(
                     rewards=rewards,
@@ -1,13 +1,12 @@
 import asyncio
 import logging
-import threading
 from urllib.parse import urlparse
 
-import aiohttp
-from eth_account import Account
+import uvloop
 from eth_account.signers.local import LocalAccount
 
-from oracle.health_server import create_health_server_runner, start_health_server
+from oracle.health_server import mount_health_server
+from oracle.oracle.common.clients import close_clients
 from oracle.oracle.common.eth1 import (
     get_finalized_block,
     get_latest_block_number,
@@ -15,6 +14,7 @@ from oracle.oracle.common.eth1 import (
     get_web3_client,
     has_synced_block,
 )
+from oracle.oracle.common.ipfs import close_ipfs_clients
 from oracle.oracle.distributor.controller import DistributorController
 from oracle.oracle.health_server import oracle_routes
 from oracle.oracle.vote import submit_vote
@@ -29,7 +29,7 @@ from oracle.settings import (
     SENTRY_DSN,
     TEST_VOTE_FILENAME,
 )
-from oracle.utils import InterruptHandler, get_oracle_account
+from oracle.utils import InterruptHandler, get_oracle_account, get_oracle_local_account
 
 logging.basicConfig(
     format="%(asctime)s %(levelname)-8s %(message)s",
@@ -43,10 +43,15 @@ logger = logging.getLogger(__name__)
 
 
 async def main() -> None:
+    health_server_runner = None
+    if ENABLE_HEALTH_SERVER:
+        logger.info(
+            f"Starting monitoring server at http://{HEALTH_SERVER_HOST}:{HEALTH_SERVER_PORT}"
+        )
+        health_server_runner = await mount_health_server(oracle_routes)
+
     oracle_account: LocalAccount = await get_oracle_account()
-    # aiohttp session
-    session = aiohttp.ClientSession()
-    await init_checks(oracle_account, session)
+    await init_checks(oracle_account)
 
     # wait for interrupt
     interrupt_handler = InterruptHandler()
@@ -57,14 +62,18 @@ async def main() -> None:
         interrupt_handler,
         distributor_controller,
     )
-    await session.close()
+    if health_server_runner is not None:
+        await health_server_runner.cleanup()
+    await close_clients()
+    close_ipfs_clients()
 
 
-async def init_checks(oracle_account, session):
+async def init_checks(oracle_account):
     # try submitting test vote
     logger.info(f"Submitting test vote for account {oracle_account.address}...")
     # noinspection PyTypeChecker
-    submit_vote(
+    await asyncio.to_thread(
+        submit_vote,
         oracle=oracle_account,
         encoded_data=b"test data",
         vote={"name": "test vote"},
@@ -95,7 +104,11 @@ async def process_network(
     interrupt_handler: InterruptHandler,
     distributor_ctrl: DistributorController,
 ) -> None:
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
     while not interrupt_handler.exit:
+        # schedule from the iteration start, so that the work time isn't added to the interval
+        next_tick = max(next_tick, loop.time()) + ORACLE_PROCESS_INTERVAL
         try:
             # fetch current finalized ETH1 block data
             finalized_block = await get_finalized_block(NETWORK)
@@ -114,29 +127,18 @@ async def process_network(
         except BaseException as e:
             logger.exception(e)
         finally:
-            await asyncio.sleep(ORACLE_PROCESS_INTERVAL)
+            await interrupt_handler.wait(max(0, next_tick - loop.time()))
 
 
 if __name__ == "__main__":
-    if ENABLE_HEALTH_SERVER:
-        t = threading.Thread(
-            target=start_health_server,
-            args=(create_health_server_runner(oracle_routes),),
-            daemon=True,
-        )
-        logger.info(
-            f"Starting monitoring server at http://{HEALTH_SERVER_HOST}:{HEALTH_SERVER_PORT}"
-        )
-        t.start()
     if SENTRY_DSN:
         import sentry_sdk
         from sentry_sdk.integrations.logging import ignore_logger
 
         sentry_sdk.init(SENTRY_DSN, traces_sample_rate=0.1)
         sentry_sdk.set_tag("network", NETWORK)
-        sentry_sdk.set_tag(
-            "account", Account.from_key(NETWORK_CONFIG["ORACLE_PRIVATE_KEY"]).address
-        )
+        sentry_sdk.set_tag("account", get_oracle_local_account().address)
         ignore_logger("backoff")
 
+    uvloop.install()
     asyncio.run(main())
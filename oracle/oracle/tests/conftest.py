@@ -0,0 +1,10 @@
+import pytest
+
+from oracle.oracle.common.clients import close_clients
+
+
+@pytest.fixture(autouse=True)
+async def clients():
+    yield
+    # shared clients are bound to the event loop of the test
+    await close_clients()
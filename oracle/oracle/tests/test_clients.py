@@ -5,10 +5,12 @@ from unittest.mock import patch
 from gql import gql
 
 from oracle.oracle.common.clients import (
+    close_clients,
     execute_sw_gql_paginated_query,
     execute_sw_gql_query,
     execute_uniswap_v3_gql_query,
     execute_uniswap_v3_paginated_gql_query,
+    get_gql_session,
 )
 
 from .common import TEST_NETWORK
@@ -102,3 +104,15 @@ class TestClients:
             execute_uniswap_v3_paginated_gql_query,
         ]:
             await self._test_paginated(query_func)
+
+    async def test_session_reuse(self):
+        first = await get_gql_session("https://example.com/subgraph")
+        second = await get_gql_session("https://example.com/subgraph")
+        other = await get_gql_session("https://example.com/other-subgraph")
+        assert first is second
+        assert first is not other
+        assert first.transport.session.connector is other.transport.session.connector
+
+        await close_clients()
+        assert await get_gql_session("https://example.com/subgraph") is not first
+        await close_clients()
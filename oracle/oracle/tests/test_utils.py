@@ -0,0 +1,104 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from oracle.utils import ttl_cache
+
+
+class TestTtlCache:
+    def test_hit(self):
+        calls = []
+
+        @ttl_cache(ttl=60)
+        def get_value(value):
+            calls.append(value)
+            return value
+
+        assert get_value(1) == 1
+        assert get_value(1) == 1
+        assert get_value(value=2) == 2
+        assert get_value(value=2) == 2
+        assert calls == [1, 2]
+
+    def test_expiry(self):
+        calls = []
+
+        @ttl_cache(ttl=60)
+        def get_value():
+            calls.append(1)
+            return len(calls)
+
+        with patch("oracle.utils.time.monotonic", return_value=100):
+            assert get_value() == 1
+        with patch("oracle.utils.time.monotonic", return_value=159):
+            assert get_value() == 1
+        with patch("oracle.utils.time.monotonic", return_value=160):
+            assert get_value() == 2
+
+    def test_list_arguments(self):
+        calls = []
+
+        @ttl_cache(ttl=60)
+        def get_total(values):
+            calls.append(values)
+            return sum(values)
+
+        assert get_total([1, 2]) == 3
+        assert get_total([1, 2]) == 3
+        assert get_total(values=[1, 2]) == 3
+        assert get_total([2, 1]) == 3
+        assert calls == [[1, 2], [1, 2], [2, 1]]
+
+    def test_cache_clear(self):
+        calls = []
+
+        @ttl_cache(ttl=60)
+        def get_value():
+            calls.append(1)
+            return len(calls)
+
+        assert get_value() == 1
+        get_value.cache_clear()
+        assert get_value() == 2
+        assert get_value() == 2
+
+    def test_exceptions_not_cached(self):
+        calls = []
+
+        @ttl_cache(ttl=60)
+        def get_value():
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError("failed")
+            return len(calls)
+
+        with pytest.raises(ValueError):
+            get_value()
+        assert get_value() == 2
+        assert get_value() == 2
+
+    def test_clear_during_call(self):
+        started = threading.Event()
+        cleared = threading.Event()
+        results = ["new", "old"]
+
+        @ttl_cache(ttl=60)
+        def get_params():
+            result = results.pop()
+            if result == "old":
+                started.set()
+                cleared.wait(timeout=5)
+            return result
+
+        thread = threading.Thread(target=get_params)
+        thread.start()
+        started.wait(timeout=5)
+        get_params.cache_clear()
+        cleared.set()
+        thread.join(timeout=5)
+
+        # the result computed before the clear is not cached
+        assert get_params() == "new"
+        assert get_params() == "new"
+        assert not results
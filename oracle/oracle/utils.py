@@ -1,10 +1,15 @@
 import asyncio
 import logging
 from collections import OrderedDict
-from functools import wraps
+from functools import lru_cache, wraps
+
+from eth_typing import ChecksumAddress
+from web3 import Web3
 
 logger = logging.getLogger(__name__)
 
+CHECKSUM_ADDRESSES_CACHE_SIZE = 131072
+
 
 def save(func):
     if asyncio.iscoroutinefunction(func):
@@ -42,3 +47,9 @@ class LimitedSizeDict(OrderedDict):
         if self.size_limit is not None:
             while len(self) > self.size_limit:
                 self.popitem(last=False)
+
+
+@lru_cache(maxsize=CHECKSUM_ADDRESSES_CACHE_SIZE)
+def to_checksum_address(value: str) -> ChecksumAddress:
+    """Converts address to checksum address. Caches the result as keccak is expensive."""
+    return Web3.toChecksumAddress(value)
@@ -1,5 +1,6 @@
 import json
 import logging
+from functools import lru_cache
 
 import backoff
 import boto3
@@ -13,6 +14,16 @@ from oracle.settings import NETWORK_CONFIG
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def get_s3_client():
+    """Returns instance of the S3 client."""
+    return boto3.client(
+        "s3",
+        aws_access_key_id=NETWORK_CONFIG["AWS_ACCESS_KEY_ID"],
+        aws_secret_access_key=NETWORK_CONFIG["AWS_SECRET_ACCESS_KEY"],
+    )
+
+
 @backoff.on_exception(backoff.expo, Exception, max_time=900)
 def submit_vote(
     oracle: LocalAccount,
@@ -22,11 +33,7 @@ def submit_vote(
 ) -> None:
     """Submits vote to the votes' aggregator."""
     aws_bucket_name = NETWORK_CONFIG["AWS_BUCKET_NAME"]
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=NETWORK_CONFIG["AWS_ACCESS_KEY_ID"],
-        aws_secret_access_key=NETWORK_CONFIG["AWS_SECRET_ACCESS_KEY"],
-    )
+    s3_client = get_s3_client()
     # generate candidate ID
     candidate_id: bytes = Web3.keccak(primitive=encoded_data)
     message = encode_defunct(primitive=candidate_id)
@@ -20,6 +20,8 @@ TEST_VOTE_FILENAME = "test-vote.json"
 ENABLE_HEALTH_SERVER = config("ENABLE_HEALTH_SERVER", default=False, cast=bool)
 HEALTH_SERVER_PORT = config("HEALTH_SERVER_PORT", default=8080, cast=int)
 HEALTH_SERVER_HOST = config("HEALTH_SERVER_HOST", default="127.0.0.1", cast=str)
+# probes must fail fast instead of waiting for the retries of a hanging node
+HEALTH_CHECK_TIMEOUT = config("HEALTH_CHECK_TIMEOUT", default=10, cast=int)
 
 # required confirmation blocks
 CONFIRMATION_BLOCKS: int = config("CONFIRMATION_BLOCKS", default=15, cast=int)
@@ -30,6 +32,9 @@ ORACLE_WITHDRAWAL_CHUNK_SIZE = config(
     "ORACLE_WITHDRAWAL_CHUNK_SIZE", default=50000, cast=int
 )
 
+# aiohttp connections pool shared by the GraphQL and IPFS clients
+AIOHTTP_CONNECTOR_LIMIT = config("AIOHTTP_CONNECTOR_LIMIT", default=200, cast=int)
+AIOHTTP_LIMIT_PER_HOST = config("AIOHTTP_LIMIT_PER_HOST", default=50, cast=int)
 
 IPFS_FETCH_ENDPOINTS = config(
     "IPFS_FETCH_ENDPOINTS",
@@ -60,6 +65,10 @@ IPFS_PINATA_SECRET_KEY = config(
 # keeper
 KEEPER_PROCESS_INTERVAL = config("KEEPER_PROCESS_INTERVAL", default=60, cast=int)
 
+# requests connections pool shared by the web3 provider and the votes fetching
+KEEPER_HTTP_POOL_SIZE = config("KEEPER_HTTP_POOL_SIZE", default=64, cast=int)
+KEEPER_HTTP_TIMEOUT = config("KEEPER_HTTP_TIMEOUT", default=30, cast=int)
+
 TRANSACTION_TIMEOUT = config("TRANSACTION_TIMEOUT", default=900, cast=int)
 
 WAD = Web3.toWei(1, "ether")
@@ -1,6 +1,10 @@
+import asyncio
 import logging
 import signal
-from typing import Any, List
+import threading
+import time
+from functools import lru_cache, wraps
+from typing import Any, Dict, List, Tuple
 
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
@@ -14,20 +18,32 @@ logger = logging.getLogger(__name__)
 
 class InterruptHandler:
     """
-    Tracks SIGINT and SIGTERM signals.
+    Tracks SIGINT and SIGTERM signals of the running event loop.
     https://stackoverflow.com/a/31464349
     """
 
-    exit = False
-
     def __init__(self) -> None:
-        signal.signal(signal.SIGINT, self.exit_gracefully)
-        signal.signal(signal.SIGTERM, self.exit_gracefully)
+        self.exit_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGINT, self.exit_gracefully, signal.SIGINT)
+        loop.add_signal_handler(signal.SIGTERM, self.exit_gracefully, signal.SIGTERM)
+
+    @property
+    def exit(self) -> bool:
+        return self.exit_event.is_set()
 
-    # noinspection PyUnusedLocal
-    def exit_gracefully(self, signum: int, frame: Any) -> None:
+    def exit_gracefully(self, signum: int) -> None:
         logger.info(f"Received interrupt signal {signum}, exiting...")
-        self.exit = True
+        self.exit_event.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Sleeps for `timeout` seconds or until the signal is received."""
+        try:
+            await asyncio.wait_for(self.exit_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        return self.exit
 
 
 async def check_oracle_account(oracle: LocalAccount) -> None:
@@ -51,9 +67,65 @@ async def check_oracle_account(oracle: LocalAccount) -> None:
         )
 
 
+@lru_cache(maxsize=1)
+def get_oracle_local_account() -> LocalAccount:
+    """Returns oracle account derived from the private key."""
+    return Account.from_key(NETWORK_CONFIG["ORACLE_PRIVATE_KEY"])
+
+
 async def get_oracle_account() -> LocalAccount:
     """Create oracle and verify oracle account."""
-    oracle = Account.from_key(NETWORK_CONFIG["ORACLE_PRIVATE_KEY"])
+    oracle = get_oracle_local_account()
     await check_oracle_account(oracle)
 
     return oracle
+
+
+def _make_cache_key(args: Tuple, kwargs: Dict) -> Tuple:
+    def _hashable(value: Any) -> Any:
+        return tuple(value) if isinstance(value, list) else value
+
+    return tuple(map(_hashable, args)), tuple(
+        (name, _hashable(value)) for name, value in sorted(kwargs.items())
+    )
+
+
+def ttl_cache(ttl: float):
+    """Caches function results for `ttl` seconds. Safe to share between threads."""
+
+    def decorator(func):
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+        lock = threading.Lock()
+        # bumped on every clear, results computed before it aren't cached
+        generation = 0
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_cache_key(args, kwargs)
+            with lock:
+                cached = cache.get(key)
+                if cached is not None and cached[0] > time.monotonic():
+                    return cached[1]
+                started_generation = generation
+
+            result = func(*args, **kwargs)
+
+            now = time.monotonic()
+            with lock:
+                for expired_key in [k for k, v in cache.items() if v[0] <= now]:
+                    del cache[expired_key]
+                if started_generation == generation:
+                    cache[key] = (now + ttl, result)
+
+            return result
+
+        def cache_clear() -> None:
+            nonlocal generation
+            with lock:
+                generation += 1
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator